@@ -15,11 +15,95 @@ import time
 import psutil
 import subprocess
 import threading
-import statistics
+import math
 from pathlib import Path
 import platform
-import traceback
+import logging
 import os
+import re
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; CPU times fall back to psutil sampling.
+    resource = None
+
+# Child discovery walks the whole process table, so it runs at a lower cadence
+# than memory/CPU sampling. Kept short because children found late lose the
+# CPU time and memory they used before being discovered.
+CHILDREN_SCAN_INTERVAL = 0.1
+# USS requires memory_full_info(), which parses smaps on Linux and costs far
+# more than memory_info(). RSS is sampled every tick; USS every Nth tick.
+USS_SAMPLE_EVERY_TICKS = 10
+# Matches class attribute values in the generated HTML input files.
+CLASS_ATTR_RE = re.compile(rb'class="([^"]*)"')
+# Number of HTML files scanned per worker task in _count_classes.
+CLASS_SCAN_CHUNK_SIZE = 256
+# HTML files at least this large are memory-mapped instead of read into memory.
+CLASS_SCAN_MMAP_MIN_SIZE = 64 * 1024
+
+# Divisor for the *_mb fields in reported metrics.
+BYTES_PER_MB = 1024 * 1024
+
+
+def scan_html_files(html_files):
+    """Collect class tokens from HTML files.
+
+    Returns a tuple of (unique class tokens as bytes, total size in bytes,
+    number of files read). All class attribute values of a file are joined
+    and split once, so tokenizing happens in C rather than per match.
+    """
+    classes = set()
+    total_size = 0
+    file_count = 0
+    for html_file in html_files:
+        try:
+            with open(html_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= CLASS_SCAN_MMAP_MIN_SIZE:
+                    # Let the regex scan the page cache directly
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        classes.update(b" ".join(CLASS_ATTR_RE.findall(content)).split())
+                else:
+                    content = f.read()
+                    size = len(content)
+                    classes.update(b" ".join(CLASS_ATTR_RE.findall(content)).split())
+            file_count += 1
+            total_size += size
+        except Exception as e:
+            logger.error("Error reading %s: %s", html_file, e)
+    return classes, total_size, file_count
+
+
+class RunningStats:
+    """Running count, mean, variance and maximum of a sample series.
+
+    Uses Welford's online algorithm so samples do not need to be stored.
+    """
+
+    def __init__(self):
+        """Initialize an empty series."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.max = 0
+
+    def add(self, value):
+        """Add a sample to the series."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value > self.max:
+            self.max = value
+
+    def stdev(self):
+        """Return the sample standard deviation (0 for fewer than two samples)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
 
 
 class ProcessMonitor:
@@ -28,22 +112,26 @@ class ProcessMonitor:
     def __init__(self):
         """Initialize the process monitor."""
         self.is_windows = platform.system() == "Windows"
-        self.is_macos = platform.system() == "Darwin"
+        # Pick the platform's memory reader once instead of branching per tick
+        if self.is_windows:
+            self._get_process_memory_components = self._memory_components_windows
+        else:
+            self._get_process_memory_components = self._memory_components_posix
         # Backward-compatible primary memory series.
-        self.memory_samples = []
+        self.memory_stats = RunningStats()
         self.peak_memory_bytes = 0
         # Additional memory series for better cross-run comparability.
-        self.memory_samples_rss = []
+        self.memory_stats_rss = RunningStats()
         self.peak_memory_bytes_rss = 0
-        self.memory_samples_uss = []
+        self.memory_stats_uss = RunningStats()
         self.peak_memory_bytes_uss = 0
         # Partial USS series: sums USS only for processes where psutil reports it.
         # This is useful on macOS where USS may be unavailable for some children.
-        self.memory_samples_uss_partial = []
+        self.memory_stats_uss_partial = RunningStats()
         self.peak_memory_bytes_uss_partial = 0
-        self.uss_coverage_samples = []  # fraction in [0..1]
-        self.process_count_samples = []
-        self.uss_available_count_samples = []
+        self.uss_coverage_stats = RunningStats()  # fraction in [0..1]
+        self.process_count_stats = RunningStats()
+        self.uss_available_count_stats = RunningStats()
         self.cpu_user_time = 0
         self.cpu_system_time = 0
         self.io_read_bytes = 0
@@ -54,44 +142,49 @@ class ProcessMonitor:
         self.memory_measurement = "unknown"
         # Tracks all processes we're monitoring
         self.monitored_processes = set()
-        # Maps PIDs to their last CPU times for delta calculations
+        # Maps PIDs to their last CPU times for delta calculations (Windows only;
+        # unused when CPU time comes from rusage)
         self.last_cpu_times = {}
         # Used to signal when monitoring should stop
         self.should_stop = False
+        # On POSIX, CPU times come from the kernel's accounting of reaped
+        # children instead of per-tick cpu_times() deltas
+        self.use_rusage = resource is not None
+        self.rusage_start = None
         # Initial process state to capture for better accuracy
         self.initial_io_counters = {}
-
-    def start_monitoring(self, pid):
-        """Start monitoring a process and its children."""
+        # Maps PIDs to their bound io_counters method (None if unsupported),
+        # probed once when the process is first seen
+        self.io_counters_methods = {}
+        # Maps PIDs to (has read_bytes, has write_bytes) for their io_counters schema
+        self.io_fields = {}
+
+    def start_monitoring(self, pid, reset=True):
+        """Start monitoring a process and its children.
+
+        With ``reset=False`` the metrics of the previous session are kept and
+        the new process is folded into them, so several sequential runs can be
+        measured as one session.
+        """
         self.should_stop = False
-        # Reset metrics for new monitoring session
-        self.memory_samples = []
-        self.peak_memory_bytes = 0
-        self.memory_samples_rss = []
-        self.peak_memory_bytes_rss = 0
-        self.memory_samples_uss = []
-        self.peak_memory_bytes_uss = 0
-        self.memory_samples_uss_partial = []
-        self.peak_memory_bytes_uss_partial = 0
-        self.uss_coverage_samples = []
-        self.process_count_samples = []
-        self.uss_available_count_samples = []
-        self.cpu_user_time = 0
-        self.cpu_system_time = 0
-        self.io_read_bytes = 0
-        self.io_write_bytes = 0
-        self.memory_measurement = "unknown"
+        if reset:
+            self._reset_metrics()
+        self.io_counters_methods = {}
+        self.io_fields = {}
+        if self.use_rusage:
+            self.rusage_start = resource.getrusage(resource.RUSAGE_CHILDREN)
 
         try:
             # Store initial process state
             process = psutil.Process(pid)
             self.monitored_processes = {process}
-            self.last_cpu_times[pid] = process.cpu_times()
+            if not self.use_rusage:
+                self.last_cpu_times[pid] = process.cpu_times()
 
             # Try to get initial I/O counters if available
             try:
-                io_counters_method = getattr(process, 'io_counters', None)
-                if io_counters_method and callable(io_counters_method):
+                io_counters_method = self._probe_io_counters(process)
+                if io_counters_method:
                     initial_io = io_counters_method()
                     if initial_io:
                         self.initial_io_counters[pid] = initial_io
@@ -99,7 +192,7 @@ class ProcessMonitor:
                 # Silently skip I/O monitoring for this process if not available
                 pass
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-            print(f"Error accessing process {pid} before monitoring: {e}")
+            logger.error("Error accessing process %s before monitoring: %s", pid, e)
 
         self.monitoring_thread = threading.Thread(
             target=self._monitor_process_tree,
@@ -109,8 +202,31 @@ class ProcessMonitor:
         self.monitoring_thread.start()
         return self.monitoring_thread
 
+    def _reset_metrics(self):
+        """Clear all collected metrics for a new monitoring session."""
+        self.memory_stats = RunningStats()
+        self.peak_memory_bytes = 0
+        self.memory_stats_rss = RunningStats()
+        self.peak_memory_bytes_rss = 0
+        self.memory_stats_uss = RunningStats()
+        self.peak_memory_bytes_uss = 0
+        self.memory_stats_uss_partial = RunningStats()
+        self.peak_memory_bytes_uss_partial = 0
+        self.uss_coverage_stats = RunningStats()
+        self.process_count_stats = RunningStats()
+        self.uss_available_count_stats = RunningStats()
+        self.cpu_user_time = 0
+        self.cpu_system_time = 0
+        self.io_read_bytes = 0
+        self.io_write_bytes = 0
+        self.memory_measurement = "unknown"
+
     def stop_monitoring(self):
-        """Signal the monitoring thread to stop."""
+        """Signal the monitoring thread to stop.
+
+        The monitored process must already have been waited for, so that its
+        CPU usage is included in the kernel's children accounting.
+        """
         self.should_stop = True
         if hasattr(self, 'monitoring_thread') and self.monitoring_thread.is_alive():
             self.monitoring_thread.join(timeout=2.0)
@@ -119,20 +235,38 @@ class ProcessMonitor:
             for proc in list(self.monitored_processes):
                 try:
                     if proc.is_running():
-                        self._update_cpu_times(proc)
+                        if not self.use_rusage:
+                            self._update_cpu_times(proc)
                         self._update_io_counters(proc)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass
 
+        if self.use_rusage and self.rusage_start is not None:
+            # Reaped descendants (including grandchildren waited for by their
+            # parents) are accounted exactly, even if the sampler missed them.
+            usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+            self.cpu_user_time += max(0, usage.ru_utime - self.rusage_start.ru_utime)
+            self.cpu_system_time += max(0, usage.ru_stime - self.rusage_start.ru_stime)
+            self.rusage_start = None
+
     def _monitor_process_tree(self, pid):
         """Monitor a process and all its children for resource usage."""
         try:
             sampling_interval = 0.01  # 10ms for high-frequency sampling
+            next_children_scan = time.monotonic()
+            next_sample = next_children_scan
+            tick = 0
 
             # Begin monitoring loop
             while not self.should_stop:
+                sample_uss = tick % USS_SAMPLE_EVERY_TICKS == 0
+                tick += 1
+
                 # Update monitored processes: add any new children
-                self._update_process_list()
+                now = time.monotonic()
+                if now >= next_children_scan:
+                    self._update_process_list()
+                    next_children_scan = now + CHILDREN_SCAN_INTERVAL
 
                 # Reset per-iteration counters
                 current_total_primary = 0
@@ -143,40 +277,59 @@ class ProcessMonitor:
                 uss_available_count = 0
                 process_count = 0
 
-                # Check all processes in our monitoring list
-                for proc in list(self.monitored_processes):
+                # Check all processes in our monitoring list. Exited processes
+                # are collected and dropped after the loop, so the set can be
+                # iterated directly without a per-tick copy.
+                dead = []
+                for proc in self.monitored_processes:
                     try:
                         if not proc.is_running():
                             # Process has terminated, remove from monitoring
-                            self.monitored_processes.remove(proc)
+                            dead.append(proc)
                             continue
 
                         process_count += 1
 
-                        # Measure memory
-                        rss_bytes, uss_bytes, private_bytes = self._get_process_memory_components(proc)
+                        # Batch the per-process reads for this tick: psutil
+                        # caches the shared kernel/procfs data for the getters
+                        # below (memory_full_info still walks smaps on Linux).
+                        with proc.oneshot():
+                            # Measure memory
+                            rss_bytes, uss_bytes, private_bytes = self._get_process_memory_components(
+                                proc, include_uss=sample_uss)
+
+                            # Measure CPU time delta (POSIX uses rusage instead)
+                            if not self.use_rusage:
+                                self._update_cpu_times(proc)
+
+                            # Measure I/O if available
+                            self._update_io_counters(proc)
 
                         # RSS is always available.
                         current_total_rss += rss_bytes
 
                         # USS is only valid if available for *all* monitored processes.
-                        if uss_bytes is None:
-                            uss_valid_for_all = False
-                        else:
-                            current_total_uss += uss_bytes
-                            current_total_uss_partial += uss_bytes
-                            uss_available_count += 1
+                        if sample_uss:
+                            if uss_bytes is None:
+                                uss_valid_for_all = False
+                            else:
+                                current_total_uss += uss_bytes
+                                current_total_uss_partial += uss_bytes
+                                uss_available_count += 1
 
                         # Primary metric is chosen after the loop based on platform and availability.
-
-                        # Measure CPU time delta
-                        self._update_cpu_times(proc)
-
-                        # Measure I/O if available
-                        self._update_io_counters(proc)
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         # Process no longer exists or can't be accessed
-                        self.monitored_processes.discard(proc)
+                        dead.append(proc)
+
+                if dead:
+                    self.monitored_processes.difference_update(dead)
+                    for proc in dead:
+                        if not self.use_rusage:
+                            self.last_cpu_times.pop(proc.pid, None)
+                        self.initial_io_counters.pop(proc.pid, None)
+                        self.io_counters_methods.pop(proc.pid, None)
+                        self.io_fields.pop(proc.pid, None)
 
                 # Choose a stable primary memory metric per-run to avoid mixing RSS/USS
                 # across samples (which makes peak comparisons meaningless).
@@ -187,10 +340,10 @@ class ProcessMonitor:
                     # Prefer summing private memory if psutil provides it.
                     current_total_private = 0
                     private_valid_for_all = True
-                    for proc in list(self.monitored_processes):
+                    for proc in self.monitored_processes:
                         try:
                             if proc.is_running():
-                                _, _, p = self._get_process_memory_components(proc)
+                                _, _, p = self._get_process_memory_components(proc, include_uss=False)
                                 if p is None:
                                     private_valid_for_all = False
                                     break
@@ -211,62 +364,81 @@ class ProcessMonitor:
 
                 # Update memory metrics only if we got a valid reading.
                 if current_total_primary > 0:
-                    self.memory_samples.append(current_total_primary)
-                    self.peak_memory_bytes = max(self.peak_memory_bytes, current_total_primary)
+                    self.memory_stats.add(current_total_primary)
+                    if current_total_primary > self.peak_memory_bytes:
+                        self.peak_memory_bytes = current_total_primary
 
                 if current_total_rss > 0:
-                    self.memory_samples_rss.append(current_total_rss)
-                    self.peak_memory_bytes_rss = max(self.peak_memory_bytes_rss, current_total_rss)
-
-                if uss_valid_for_all and current_total_uss > 0:
-                    self.memory_samples_uss.append(current_total_uss)
-                    self.peak_memory_bytes_uss = max(self.peak_memory_bytes_uss, current_total_uss)
-
-                # Always record partial-USS (may undercount) and coverage.
-                if current_total_uss_partial > 0:
-                    self.memory_samples_uss_partial.append(current_total_uss_partial)
-                    self.peak_memory_bytes_uss_partial = max(
-                        self.peak_memory_bytes_uss_partial, current_total_uss_partial
-                    )
-
-                if process_count > 0:
-                    self.uss_coverage_samples.append(uss_available_count / process_count)
-                    self.process_count_samples.append(process_count)
-                    self.uss_available_count_samples.append(uss_available_count)
-
-                time.sleep(sampling_interval)
+                    self.memory_stats_rss.add(current_total_rss)
+                    if current_total_rss > self.peak_memory_bytes_rss:
+                        self.peak_memory_bytes_rss = current_total_rss
+
+                if sample_uss and uss_valid_for_all and current_total_uss > 0:
+                    self.memory_stats_uss.add(current_total_uss)
+                    if current_total_uss > self.peak_memory_bytes_uss:
+                        self.peak_memory_bytes_uss = current_total_uss
+
+                # Always record partial-USS (may undercount) and coverage on USS ticks.
+                if sample_uss and current_total_uss_partial > 0:
+                    self.memory_stats_uss_partial.add(current_total_uss_partial)
+                    if current_total_uss_partial > self.peak_memory_bytes_uss_partial:
+                        self.peak_memory_bytes_uss_partial = current_total_uss_partial
+
+                if sample_uss and process_count > 0:
+                    self.uss_coverage_stats.add(uss_available_count / process_count)
+                    self.process_count_stats.add(process_count)
+                    self.uss_available_count_stats.add(uss_available_count)
+
+                # Sleep until the next tick on a fixed schedule so sampling work
+                # doesn't stretch the interval; if we fell behind, resync instead
+                # of bursting to catch up.
+                next_sample += sampling_interval
+                delay = next_sample - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_sample = time.monotonic()
 
                 # If the main process isn't running and has no children, we can stop
                 if not self.monitored_processes:
                     break
 
         except Exception as e:
-            print(f"Error in monitoring thread: {e}")
-            traceback.print_exc()
+            # logger.exception only formats the traceback if ERROR is enabled
+            logger.exception("Error in monitoring thread: %s", e)
+
+    def _memory_components_windows(self, proc, include_uss=True):
+        """Return (rss_bytes, None, private_bytes_or_None) using the private working set.
 
-    def _get_process_memory_components(self, proc):
-        """Return (rss_bytes, uss_bytes_or_None, private_bytes_or_None)."""
+        USS is not queried on Windows; ``include_uss`` is accepted for a uniform signature.
+        """
         try:
             memory_info = proc.memory_info()
             rss = getattr(memory_info, 'rss', 0) or 0
+            return rss, None, getattr(memory_info, 'private', None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return 0, None, None
 
-            uss = None
-            private = None
+    def _memory_components_posix(self, proc, include_uss=True):
+        """Return (rss_bytes, uss_bytes_or_None, None) on macOS/Linux.
 
-            # Windows: private working set.
-            if self.is_windows:
-                private = getattr(memory_info, 'private', None)
-                return rss, uss, private
+        USS is only queried when ``include_uss`` is set; otherwise it is None.
+        """
+        try:
+            memory_info = proc.memory_info()
+            rss = getattr(memory_info, 'rss', 0) or 0
 
-            # macOS/Linux: try USS if available.
-            try:
-                memory_full = proc.memory_full_info()
-                if hasattr(memory_full, 'uss'):
-                    uss = getattr(memory_full, 'uss')
-            except Exception:
-                uss = None
+            uss = None
+            if include_uss:
+                # Try USS if available.
+                try:
+                    memory_full = proc.memory_full_info()
+                    if hasattr(memory_full, 'uss'):
+                        uss = getattr(memory_full, 'uss')
+                except Exception:
+                    uss = None
 
-            return rss, uss, private
+            return rss, uss, None
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return 0, None, None
 
@@ -283,57 +455,32 @@ class ProcessMonitor:
                         if child not in self.monitored_processes:
                             self.monitored_processes.add(child)
                             try:
-                                self.last_cpu_times[child.pid] = child.cpu_times(
-                                )
-                                # Handle I/O counters in a more robust way
-                                try:
-                                    # Check if the process has io_counters available through callable method
-                                    # instead of directly accessing the attribute
-                                    io_counters_method = getattr(
-                                        child, 'io_counters', None)
-                                    if io_counters_method and callable(io_counters_method):
-                                        io_counters = io_counters_method()
-                                        self.initial_io_counters[child.pid] = io_counters
-                                except (psutil.AccessDenied, psutil.NoSuchProcess):
-                                    # Skip I/O monitoring for this process if we can't access it
-                                    pass
+                                with child.oneshot():
+                                    if not self.use_rusage:
+                                        self.last_cpu_times[child.pid] = child.cpu_times()
+                                    # Handle I/O counters in a more robust way
+                                    try:
+                                        io_counters_method = self._probe_io_counters(child)
+                                        if io_counters_method:
+                                            io_counters = io_counters_method()
+                                            self.initial_io_counters[child.pid] = io_counters
+                                    except (psutil.AccessDenied, psutil.NoSuchProcess):
+                                        # Skip I/O monitoring for this process if we can't access it
+                                        pass
                             except (psutil.NoSuchProcess, psutil.AccessDenied):
                                 pass
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 self.monitored_processes.discard(proc)
 
-    def _get_process_memory(self, proc):
-        """Get memory usage for a process using the most accurate method for the platform."""
-        try:
-            if self.is_windows:
-                # On Windows, use private working set for exclusive memory usage
-                self.memory_measurement = "private"
-                return proc.memory_info().private
-            elif self.is_macos:
-                # On macOS, use rss - shared memory for better accuracy
-                memory_info = proc.memory_info()
-                try:
-                    # Try to get more accurate measurement on macOS if available
-                    memory_full = proc.memory_full_info()
-                    if hasattr(memory_full, 'uss'):
-                        self.memory_measurement = "uss"
-                        return getattr(memory_full, 'uss')
-
-                    self.memory_measurement = "rss"
-                    return memory_info.rss
-                except:
-                    self.memory_measurement = "rss"
-                    return memory_info.rss
-            else:
-                # On Linux, USS (Unique Set Size) is most accurate
-                try:
-                    self.memory_measurement = "uss"
-                    return proc.memory_full_info().uss
-                except:
-                    self.memory_measurement = "rss"
-                    return proc.memory_info().rss
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return 0
+    def _probe_io_counters(self, proc):
+        """Cache and return the bound io_counters method for a process, or None."""
+        # Check if the process has io_counters available through callable method
+        # instead of directly accessing the attribute
+        io_counters_method = getattr(proc, 'io_counters', None)
+        if not callable(io_counters_method):
+            io_counters_method = None
+        self.io_counters_methods[proc.pid] = io_counters_method
+        return io_counters_method
 
     def _update_cpu_times(self, proc):
         """Update CPU time measurements for a process."""
@@ -359,8 +506,8 @@ class ProcessMonitor:
     def _update_io_counters(self, proc):
         """Update I/O counters if available."""
         try:
-            io_counters_method = getattr(proc, 'io_counters', None)
-            if not io_counters_method or not callable(io_counters_method):
+            io_counters_method = self.io_counters_methods.get(proc.pid)
+            if io_counters_method is None:
                 # Skip silently if method doesn't exist - this is expected on some platforms
                 return
 
@@ -371,15 +518,22 @@ class ProcessMonitor:
             if pid in self.initial_io_counters:
                 initial_io = self.initial_io_counters[pid]
 
-                # Check if the counters have the required attributes
-                if hasattr(current_io, 'read_bytes') and hasattr(initial_io, 'read_bytes'):
-                    read_delta = max(0, getattr(
-                        current_io, 'read_bytes') - getattr(initial_io, 'read_bytes'))
+                # Both readings come from the same method, so which byte
+                # counters the platform provides only needs checking once
+                fields = self.io_fields.get(pid)
+                if fields is None:
+                    fields = self.io_fields[pid] = (
+                        hasattr(initial_io, 'read_bytes') and hasattr(current_io, 'read_bytes'),
+                        hasattr(initial_io, 'write_bytes') and hasattr(current_io, 'write_bytes'),
+                    )
+                has_read_bytes, has_write_bytes = fields
+
+                if has_read_bytes:
+                    read_delta = max(0, current_io.read_bytes - initial_io.read_bytes)
                     self.io_read_bytes += read_delta
 
-                if hasattr(current_io, 'write_bytes') and hasattr(initial_io, 'write_bytes'):
-                    write_delta = max(0, getattr(
-                        current_io, 'write_bytes') - getattr(initial_io, 'write_bytes'))
+                if has_write_bytes:
+                    write_delta = max(0, current_io.write_bytes - initial_io.write_bytes)
                     self.io_write_bytes += write_delta
             else:
                 # For first measurement, store current values as initial
@@ -394,29 +548,29 @@ class ProcessMonitor:
         metrics = {
             "memory": {
                 "peak_bytes": self.peak_memory_bytes,
-                "peak_mb": self.peak_memory_bytes / (1024 * 1024),
-                "avg_bytes": statistics.mean(self.memory_samples) if self.memory_samples else 0,
-                "avg_mb": statistics.mean(self.memory_samples) / (1024 * 1024) if self.memory_samples else 0,
+                "peak_mb": self.peak_memory_bytes / BYTES_PER_MB,
+                "avg_bytes": self.memory_stats.mean,
+                "avg_mb": self.memory_stats.mean / BYTES_PER_MB,
                 "measurement": self.memory_measurement,
                 # Additional series (may be empty if not measurable).
                 "rss_peak_bytes": self.peak_memory_bytes_rss,
-                "rss_peak_mb": self.peak_memory_bytes_rss / (1024 * 1024),
-                "rss_avg_bytes": statistics.mean(self.memory_samples_rss) if self.memory_samples_rss else 0,
-                "rss_avg_mb": statistics.mean(self.memory_samples_rss) / (1024 * 1024) if self.memory_samples_rss else 0,
+                "rss_peak_mb": self.peak_memory_bytes_rss / BYTES_PER_MB,
+                "rss_avg_bytes": self.memory_stats_rss.mean,
+                "rss_avg_mb": self.memory_stats_rss.mean / BYTES_PER_MB,
                 "uss_peak_bytes": self.peak_memory_bytes_uss,
-                "uss_peak_mb": self.peak_memory_bytes_uss / (1024 * 1024),
-                "uss_avg_bytes": statistics.mean(self.memory_samples_uss) if self.memory_samples_uss else 0,
-                "uss_avg_mb": statistics.mean(self.memory_samples_uss) / (1024 * 1024) if self.memory_samples_uss else 0,
-                "uss_is_complete": bool(self.memory_samples_uss),
+                "uss_peak_mb": self.peak_memory_bytes_uss / BYTES_PER_MB,
+                "uss_avg_bytes": self.memory_stats_uss.mean,
+                "uss_avg_mb": self.memory_stats_uss.mean / BYTES_PER_MB,
+                "uss_is_complete": self.memory_stats_uss.count > 0,
                 "uss_partial_peak_bytes": self.peak_memory_bytes_uss_partial,
-                "uss_partial_peak_mb": self.peak_memory_bytes_uss_partial / (1024 * 1024),
-                "uss_partial_avg_bytes": statistics.mean(self.memory_samples_uss_partial) if self.memory_samples_uss_partial else 0,
-                "uss_partial_avg_mb": statistics.mean(self.memory_samples_uss_partial) / (1024 * 1024) if self.memory_samples_uss_partial else 0,
-                "uss_coverage_avg": statistics.mean(self.uss_coverage_samples) if self.uss_coverage_samples else 0,
-                "uss_process_count_avg": statistics.mean(self.process_count_samples) if self.process_count_samples else 0,
-                "uss_process_count_max": max(self.process_count_samples) if self.process_count_samples else 0,
-                "uss_available_count_avg": statistics.mean(self.uss_available_count_samples) if self.uss_available_count_samples else 0,
-                "uss_available_count_max": max(self.uss_available_count_samples) if self.uss_available_count_samples else 0,
+                "uss_partial_peak_mb": self.peak_memory_bytes_uss_partial / BYTES_PER_MB,
+                "uss_partial_avg_bytes": self.memory_stats_uss_partial.mean,
+                "uss_partial_avg_mb": self.memory_stats_uss_partial.mean / BYTES_PER_MB,
+                "uss_coverage_avg": self.uss_coverage_stats.mean,
+                "uss_process_count_avg": self.process_count_stats.mean,
+                "uss_process_count_max": self.process_count_stats.max,
+                "uss_available_count_avg": self.uss_available_count_stats.mean,
+                "uss_available_count_max": self.uss_available_count_stats.max,
             },
             "cpu": {
                 "user_time": self.cpu_user_time,
@@ -425,16 +579,15 @@ class ProcessMonitor:
             },
             "io": {
                 "read_bytes": self.io_read_bytes,
-                "read_mb": self.io_read_bytes / (1024 * 1024),
+                "read_mb": self.io_read_bytes / BYTES_PER_MB,
                 "write_bytes": self.io_write_bytes,
-                "write_mb": self.io_write_bytes / (1024 * 1024)
+                "write_mb": self.io_write_bytes / BYTES_PER_MB
             }
         }
 
         # Add standard deviation for memory if we have enough samples
-        if len(self.memory_samples) > 1:
-            metrics["memory"]["std_dev_mb"] = statistics.stdev(
-                self.memory_samples) / (1024 * 1024)
+        if self.memory_stats.count > 1:
+            metrics["memory"]["std_dev_mb"] = self.memory_stats.stdev() / BYTES_PER_MB
 
         return metrics
 
@@ -458,30 +611,17 @@ class OutputAnalyzer:
         }
 
         if not self.output_dir.exists():
-            print(
-                f"Warning: Output directory {self.output_dir} does not exist")
+            logger.warning("Warning: Output directory %s does not exist", self.output_dir)
             return result
 
         total_size = 0
         file_count = 0
-        css_files = set()
-
-        # Look for CSS files in the main directory
-        for css_file in self.output_dir.glob("*.css"):
-            css_files.add(css_file)
 
-        # Also check for CSS files in subdirectories
-        for css_file in self.output_dir.glob("**/*.css"):
-            css_files.add(css_file)
-
-        # Process all unique CSS files
-        for css_file in css_files:
-            try:
-                file_size = css_file.stat().st_size
-                total_size += file_size
-                file_count += 1
-            except Exception as e:
-                print(f"Error analyzing CSS file {css_file}: {e}")
+        # One walk covers the main directory as well as subdirectories,
+        # so every CSS file is seen exactly once
+        for file_size in self._css_file_sizes(self.output_dir):
+            total_size += file_size
+            file_count += 1
 
         # Update result only if we found files
         if file_count > 0:
@@ -493,6 +633,25 @@ class OutputAnalyzer:
 
         return result
 
+    def _css_file_sizes(self, directory):
+        """Yield the size of every CSS file under directory, recursively.
+
+        Uses os.scandir so file types come from the directory listing and
+        sizes from DirEntry.stat(), avoiding a separate path lookup per file.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            yield from self._css_file_sizes(entry.path)
+                        elif entry.name.endswith(".css") and entry.is_file():
+                            yield entry.stat().st_size
+                    except OSError as e:
+                        logger.error("Error analyzing CSS file %s: %s", entry.path, e)
+        except OSError as e:
+            logger.error("Error scanning output directory %s: %s", directory, e)
+
 
 class MetricsCollector:
     """Base class for collecting and analyzing performance metrics for CSS frameworks."""
@@ -509,36 +668,32 @@ class MetricsCollector:
 
     def _count_classes(self, input_dir="input"):
         """Count the total number of classes in the input files."""
-        import re
         input_path = Path(input_dir)
         if not input_path.exists():
-            print(f"Warning: Input directory {input_path} does not exist")
+            logger.warning("Warning: Input directory %s does not exist", input_path)
             return {"unique_class_count": 0, "total_input_size_bytes": 0}
 
-        class_pattern = r'class="([^"]*)"'
+        # Classes are collected as bytes; only the count of unique values matters.
         unique_classes = set()
 
         # Count total input size for I/O efficiency calculation
         total_input_size = 0
         file_count = 0
 
-        # Process each project directory
-        for project_dir in input_path.glob("project*"):
-            # Process HTML files in each project
-            for html_file in project_dir.glob("*.html"):
-                try:
-                    with open(html_file, 'r') as f:
-                        content = f.read()
-                        file_count += 1
-                        total_input_size += len(content)
-                        for match in re.finditer(class_pattern, content):
-                            class_values = match.group(1).split()
-                            unique_classes.update(class_values)
-                except Exception as e:
-                    print(f"Error reading {html_file}: {e}")
+        # Process HTML files in each project directory. File reads release the
+        # GIL, so chunks of files are scanned concurrently and merged here.
+        html_files = list(input_path.glob("project*/*.html"))
+        chunks = [html_files[i:i + CLASS_SCAN_CHUNK_SIZE]
+                  for i in range(0, len(html_files), CLASS_SCAN_CHUNK_SIZE)]
 
-        print(
-            f"Found {len(unique_classes)} unique CSS classes in {file_count} HTML files")
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(chunks)))) as executor:
+            for classes, size, count in executor.map(scan_html_files, chunks):
+                unique_classes |= classes
+                total_input_size += size
+                file_count += count
+
+        logger.info("Found %d unique CSS classes in %d HTML files",
+                    len(unique_classes), file_count)
         return {
             "unique_class_count": len(unique_classes),
             "total_input_size_bytes": total_input_size,
@@ -547,7 +702,7 @@ class MetricsCollector:
 
     def prepare_benchmark(self):
         """Count classes and prepare for benchmark (to be implemented by subclasses)."""
-        print("Counting classes in input files...")
+        logger.info("Counting classes in input files...")
         input_metrics = self._count_classes()
         self.input_files_size = input_metrics["total_input_size_bytes"]
 
@@ -557,14 +712,18 @@ class MetricsCollector:
                 try:
                     css_file.unlink()
                 except Exception as e:
-                    print(f"Error removing file {css_file}: {e}")
+                    logger.error("Error removing file %s: %s", css_file, e)
 
         return input_metrics
 
-    def run_process(self, cmd, cwd=None):
-        """Run a process and collect metrics."""
-        # Start timing
-        start_time = time.time()
+    def run_process(self, cmd, cwd=None, continue_session=False):
+        """Run a process and collect metrics.
+
+        With ``continue_session`` the returned metrics also include every
+        earlier run since the last run that started a fresh session.
+        """
+        # Start timing (perf_counter is monotonic and high resolution)
+        start_time = time.perf_counter()
 
         # Launch the process
         process = subprocess.Popen(
@@ -576,20 +735,21 @@ class MetricsCollector:
         )
 
         # Start monitoring
-        self.process_monitor.start_monitoring(process.pid)
+        self.process_monitor.start_monitoring(
+            process.pid, reset=not continue_session)
 
         # Wait for the process to complete
         stdout, stderr = process.communicate()
 
         # End timing
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         # Stop monitoring
         self.process_monitor.stop_monitoring()
 
         # Print process output for debugging
         if stderr and stderr.strip():
-            print(f"Process stderr: {stderr.strip()}")
+            logger.info("Process stderr: %s", stderr.strip())
 
         # Calculate elapsed time
         elapsed_time = end_time - start_time
@@ -604,13 +764,11 @@ class MetricsCollector:
         # Update IO metrics based on actual file sizes if process monitoring failed to capture
         if process_metrics["io"]["read_bytes"] < self.input_files_size:
             process_metrics["io"]["read_bytes"] = self.input_files_size
-            process_metrics["io"]["read_mb"] = self.input_files_size / \
-                (1024 * 1024)
+            process_metrics["io"]["read_mb"] = self.input_files_size / BYTES_PER_MB
 
         if process_metrics["io"]["write_bytes"] < self.output_files_size:
             process_metrics["io"]["write_bytes"] = self.output_files_size
-            process_metrics["io"]["write_mb"] = self.output_files_size / \
-                (1024 * 1024)
+            process_metrics["io"]["write_mb"] = self.output_files_size / BYTES_PER_MB
 
         # Calculate throughput metrics
         throughput_metrics = {
@@ -665,7 +823,7 @@ class GrimoireMetricsCollector(MetricsCollector):
             input_metrics = self.prepare_benchmark()
 
             # Step 2: Run the build process and collect metrics
-            print("Running Grimoire CSS build...")
+            logger.info("Running Grimoire CSS build...")
             cmd = [self.executable, "build"]
             process, elapsed_time, process_metrics, stdout, stderr = self.run_process(
                 cmd)
@@ -673,7 +831,7 @@ class GrimoireMetricsCollector(MetricsCollector):
             # dhat (heap profiling) drastically slows execution and changes allocation behavior.
             # If it's enabled, the reported build time is not comparable to normal runs.
             if stderr and "dhat:" in stderr:
-                print("Warning: dhat heap profiling detected in Grimoire process output. Build time is not comparable; disable heap profiling for performance benchmarks.")
+                logger.warning("Warning: dhat heap profiling detected in Grimoire process output. Build time is not comparable; disable heap profiling for performance benchmarks.")
 
             # Step 3: Analyze output files
             output_metrics = self.output_analyzer.analyze()
@@ -696,8 +854,7 @@ class GrimoireMetricsCollector(MetricsCollector):
 
             return result
         except Exception as e:
-            print(f"Error running Grimoire CSS benchmark: {e}")
-            traceback.print_exc()
+            logger.exception("Error running Grimoire CSS benchmark: %s", e)
             return None
 
 
@@ -715,33 +872,12 @@ class TailwindMetricsCollector(MetricsCollector):
             input_metrics = self.prepare_benchmark()
 
             # Step 2: Run Tailwind CSS for each project
-            print("Running Tailwind CSS build...")
+            logger.info("Running Tailwind CSS build...")
 
-            # Track total metrics across all projects
+            # All projects are measured as one monitoring session, so memory,
+            # CPU and IO metrics cover every build; wall time is summed
             total_elapsed_time = 0
-            combined_process_metrics = {
-                "memory": {
-                    "peak_bytes": 0,
-                    "peak_mb": 0.0,
-                    "avg_bytes": 0,
-                    "avg_mb": 0.0,
-                    "std_dev_mb": 0.0
-                },
-                "cpu": {
-                    "user_time": 0,
-                    "system_time": 0,
-                    "total_time": 0
-                },
-                "io": {
-                    "read_bytes": 0,
-                    "read_mb": 0.0,
-                    "write_bytes": 0,
-                    "write_mb": 0.0
-                }
-            }
-
-            # Track all memory samples to calculate overall average
-            all_memory_samples = []
+            combined_process_metrics = None
 
             # Process each project directory
             input_path = Path("input")
@@ -749,7 +885,7 @@ class TailwindMetricsCollector(MetricsCollector):
 
             for project_dir in project_dirs:
                 project_name = project_dir.name
-                print(f"Processing {project_name}...")
+                logger.info("Processing %s...", project_name)
 
                 output_file = f"{self.output_dir}/{project_name}.css"
 
@@ -760,48 +896,14 @@ class TailwindMetricsCollector(MetricsCollector):
                        "-o", f"../../{output_file}",
                        "-m"]
 
-                project_process, project_elapsed_time, project_metrics, stdout, stderr = self.run_process(
-                    cmd, cwd=str(project_dir))
+                project_process, project_elapsed_time, combined_process_metrics, stdout, stderr = self.run_process(
+                    cmd, cwd=str(project_dir),
+                    continue_session=combined_process_metrics is not None)
 
-                # Accumulate metrics
                 total_elapsed_time += project_elapsed_time
-                combined_process_metrics["cpu"]["user_time"] += project_metrics["cpu"]["user_time"]
-                combined_process_metrics["cpu"]["system_time"] += project_metrics["cpu"]["system_time"]
-                combined_process_metrics["cpu"]["total_time"] += project_metrics["cpu"]["total_time"]
-                combined_process_metrics["io"]["read_bytes"] += project_metrics["io"]["read_bytes"]
-                combined_process_metrics["io"]["write_bytes"] += project_metrics["io"]["write_bytes"]
-
-                # Track peak memory
-                combined_process_metrics["memory"]["peak_bytes"] = max(
-                    combined_process_metrics["memory"]["peak_bytes"],
-                    project_metrics["memory"]["peak_bytes"]
-                )
-
-                # Collect memory samples for overall average calculation
-                process_monitor_samples = getattr(
-                    self.process_monitor, 'memory_samples', [])
-                if process_monitor_samples:
-                    all_memory_samples.extend(process_monitor_samples)
-
-            # Calculate combined averages
-            if all_memory_samples:
-                combined_process_metrics["memory"]["avg_bytes"] = statistics.mean(
-                    all_memory_samples)
-                combined_process_metrics["memory"]["avg_mb"] = combined_process_metrics["memory"]["avg_bytes"] / (
-                    1024 * 1024)
-                if len(all_memory_samples) > 1:
-                    std_dev = statistics.stdev(all_memory_samples)
-                    combined_process_metrics["memory"]["std_dev_mb"] = std_dev / (
-                        1024 * 1024)
-
-            # Update peak MB
-            combined_process_metrics["memory"]["peak_mb"] = combined_process_metrics["memory"]["peak_bytes"] / (
-                1024 * 1024)
-            # Update IO in MB
-            combined_process_metrics["io"]["read_mb"] = combined_process_metrics["io"]["read_bytes"] / (
-                1024 * 1024)
-            combined_process_metrics["io"]["write_mb"] = combined_process_metrics["io"]["write_bytes"] / (
-                1024 * 1024)
+
+            if combined_process_metrics is None:
+                combined_process_metrics = self.process_monitor.get_metrics()
 
             # Step 3: Analyze output files
             output_metrics = self.output_analyzer.analyze()
@@ -821,6 +923,5 @@ class TailwindMetricsCollector(MetricsCollector):
 
             return result
         except Exception as e:
-            print(f"Error running Tailwind CSS benchmark: {e}")
-            traceback.print_exc()
+            logger.exception("Error running Tailwind CSS benchmark: %s", e)
             return None
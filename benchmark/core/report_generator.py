@@ -5,10 +5,14 @@ Report Generator for CSS Framework Performance Benchmark
 Formats and displays benchmark results with meaningful interpretations.
 Highlights key metrics for assessing the performance of CSS frameworks.
 """
-import time
+import io
 from datetime import datetime
+from functools import lru_cache
 
 
+# typed=True keeps equal int and float values (e.g. 512 and 512.0) apart,
+# since they format differently
+@lru_cache(maxsize=256, typed=True)
 def format_bytes(bytes_value, precision=2):
     """Format bytes value to human-readable format."""
     if bytes_value < 1024:
@@ -21,6 +25,7 @@ def format_bytes(bytes_value, precision=2):
         return f"{bytes_value/(1024**3):.{precision}f} GB"
 
 
+@lru_cache(maxsize=256, typed=True)
 def format_time(seconds):
     """Format time in seconds to appropriate units."""
     if seconds < 0.001:
@@ -31,6 +36,35 @@ def format_time(seconds):
         return f"{seconds:.2f} s"
 
 
+def _header_block(system_info):
+    """Return the "Generated" line and system information section shared by both reports."""
+    # Only fall back to the current time when the results carry no timestamp
+    if "timestamp_human" in system_info:
+        timestamp = system_info["timestamp_human"]
+    else:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    if not system_info:
+        return f"Generated: {timestamp}\n"
+
+    os_info = system_info.get('os', {})
+    cpu_info = system_info.get('cpu', {})
+    block = f"""Generated: {timestamp}
+
+SYSTEM INFORMATION
+{"-" * 80}
+OS:      {os_info.get('name', 'Unknown')} {os_info.get('release', '')}
+CPU:     {cpu_info.get('name', 'Unknown')}
+Cores:   {cpu_info.get('cores_physical', 'Unknown')} physical, {cpu_info.get('cores_logical', 'Unknown')} logical
+Memory:  {system_info.get('memory', {}).get('total_gb', 'Unknown')} GB
+"""
+
+    jobs_value = system_info.get('benchmark', {}).get('grimoire_css_jobs', None)
+    if jobs_value is not None:
+        block += f"GRIMOIRE_CSS_JOBS: {jobs_value}\n"
+    return block
+
+
 def generate_report(results):
     """Generate a formatted report from benchmark results."""
     if not results or "metrics" not in results or not results["metrics"]:
@@ -40,70 +74,53 @@ def generate_report(results):
     system_info = results.get("system_info", {})
     framework_name = results.get("framework", "CSS Framework")
 
+    # Bind the metric sections once instead of re-walking them per line
+    input_metrics = metrics["input"]
+    throughput = metrics["throughput"]
+    process = metrics["process"]
+    mem = process["memory"]
+    cpu_times = process["cpu"]
+    io_metrics = process["io"]
+    output = metrics["output"]
+
     # Format the report
-    lines = []
-    lines.append("=" * 80)
-    lines.append(f"{framework_name.upper()} PERFORMANCE BENCHMARK REPORT")
-    lines.append("=" * 80)
-
-    # Add timestamp
-    timestamp = system_info.get("timestamp_human",
-                                datetime.fromtimestamp(time.time()).strftime("%Y-%m-%d %H:%M:%S"))
-    lines.append(f"Generated: {timestamp}")
-
-    # Add system info if available
-    if system_info:
-        lines.append("\nSYSTEM INFORMATION")
-        lines.append("-" * 80)
-        lines.append(
-            f"OS:      {system_info.get('os', {}).get('name', 'Unknown')} {system_info.get('os', {}).get('release', '')}")
-        lines.append(
-            f"CPU:     {system_info.get('cpu', {}).get('name', 'Unknown')}")
-        lines.append(
-            f"Cores:   {system_info.get('cpu', {}).get('cores_physical', 'Unknown')} physical, {system_info.get('cpu', {}).get('cores_logical', 'Unknown')} logical")
-        lines.append(
-            f"Memory:  {system_info.get('memory', {}).get('total_gb', 'Unknown')} GB")
-
-        jobs_value = system_info.get('benchmark', {}).get('grimoire_css_jobs', None)
-        if jobs_value is not None:
-            lines.append(f"GRIMOIRE_CSS_JOBS: {jobs_value}")
+    buf = io.StringIO()
+    w = buf.write
+    w("=" * 80 + "\n")
+    w(f"{framework_name.upper()} PERFORMANCE BENCHMARK REPORT\n")
+    w("=" * 80 + "\n")
+
+    w(_header_block(system_info))
 
     # Input summary
-    lines.append("\nINPUT SUMMARY")
-    lines.append("-" * 80)
-    lines.append(
-        f"Unique Utility Classes: {metrics['input']['unique_class_count']}")
-    lines.append(
-        f"Total Input Size: {format_bytes(metrics['input']['total_input_size_bytes'])}")
-    if 'file_count' in metrics['input']:
-        lines.append(f"Input HTML Files: {metrics['input']['file_count']}")
+    w("\nINPUT SUMMARY\n")
+    w("-" * 80 + "\n")
+    w(f"Unique Utility Classes: {input_metrics['unique_class_count']}\n")
+    w(f"Total Input Size: {format_bytes(input_metrics['total_input_size_bytes'])}\n")
+    if 'file_count' in input_metrics:
+        w(f"Input HTML Files: {input_metrics['file_count']}\n")
 
     # Performance metrics
-    lines.append("\nPERFORMANCE METRICS")
-    lines.append("-" * 80)
-    lines.append(
-        f"Build Time: {format_time(metrics['throughput']['build_time_seconds'])}")
-    lines.append(
-        f"Processing Speed: {metrics['throughput']['classes_per_second']:.2f} classes/second")
+    w("\nPERFORMANCE METRICS\n")
+    w("-" * 80 + "\n")
+    w(f"Build Time: {format_time(throughput['build_time_seconds'])}\n")
+    w(f"Processing Speed: {throughput['classes_per_second']:.2f} classes/second\n")
 
     # Memory metrics
-    lines.append("\nMEMORY USAGE")
-    lines.append("-" * 80)
-    lines.append(
-        f"Peak Memory: {metrics['process']['memory']['peak_mb']:.2f} MB")
-    lines.append(
-        f"Average Memory: {metrics['process']['memory']['avg_mb']:.2f} MB")
-
-    mem = metrics.get('process', {}).get('memory', {})
+    w("\nMEMORY USAGE\n")
+    w("-" * 80 + "\n")
+    w(f"Peak Memory: {mem['peak_mb']:.2f} MB\n")
+    w(f"Average Memory: {mem['avg_mb']:.2f} MB\n")
+
     # If available, show both RSS and USS for better comparability.
     if 'rss_peak_mb' in mem:
-        lines.append(f"Peak RSS: {mem.get('rss_peak_mb', 0.0):.2f} MB")
-        lines.append(f"Average RSS: {mem.get('rss_avg_mb', 0.0):.2f} MB")
+        w(f"Peak RSS: {mem.get('rss_peak_mb', 0.0):.2f} MB\n")
+        w(f"Average RSS: {mem.get('rss_avg_mb', 0.0):.2f} MB\n")
 
     # USS may be unavailable for some processes on macOS; if so, report a partial total + coverage.
     if mem.get('uss_is_complete') and 'uss_peak_mb' in mem:
-        lines.append(f"Peak USS: {mem.get('uss_peak_mb', 0.0):.2f} MB")
-        lines.append(f"Average USS: {mem.get('uss_avg_mb', 0.0):.2f} MB")
+        w(f"Peak USS: {mem.get('uss_peak_mb', 0.0):.2f} MB\n")
+        w(f"Average USS: {mem.get('uss_avg_mb', 0.0):.2f} MB\n")
     elif 'uss_coverage_avg' in mem:
         coverage_pct = float(mem.get('uss_coverage_avg', 0.0)) * 100.0
         proc_avg = float(mem.get('uss_process_count_avg', 0.0))
@@ -112,47 +129,36 @@ def generate_report(results):
         uss_max = int(mem.get('uss_available_count_max', 0) or 0)
 
         if mem.get('uss_partial_peak_bytes', 0) and 'uss_partial_peak_mb' in mem:
-            lines.append(f"Peak USS (partial): {mem.get('uss_partial_peak_mb', 0.0):.2f} MB")
-            lines.append(f"Average USS (partial): {mem.get('uss_partial_avg_mb', 0.0):.2f} MB")
+            w(f"Peak USS (partial): {mem.get('uss_partial_peak_mb', 0.0):.2f} MB\n")
+            w(f"Average USS (partial): {mem.get('uss_partial_avg_mb', 0.0):.2f} MB\n")
         else:
-            lines.append("USS: unavailable for monitored process tree")
+            w("USS: unavailable for monitored process tree\n")
 
-        lines.append(
-            f"USS Coverage (avg): {coverage_pct:.1f}% (avg {uss_avg:.1f}/{proc_avg:.1f} procs, max {uss_max}/{proc_max})"
-        )
+        w(f"USS Coverage (avg): {coverage_pct:.1f}% (avg {uss_avg:.1f}/{proc_avg:.1f} procs, max {uss_max}/{proc_max})\n")
     if mem.get('measurement'):
-        lines.append(f"Primary Memory Metric: {mem.get('measurement')}")
-    if "memory_efficiency" in metrics["throughput"]:
-        lines.append(
-            f"Memory Efficiency: {metrics['throughput']['memory_efficiency']:.2f} classes/MB")
-    if "std_dev_mb" in metrics["process"]["memory"]:
-        lines.append(
-            f"Memory Stability (Std Dev): {metrics['process']['memory']['std_dev_mb']:.2f} MB")
-    lines.append(
-        f"Memory per Class: {metrics['process']['memory']['peak_bytes'] / max(1, metrics['input']['unique_class_count']):.2f} bytes/class")
+        w(f"Primary Memory Metric: {mem.get('measurement')}\n")
+    if "memory_efficiency" in throughput:
+        w(f"Memory Efficiency: {throughput['memory_efficiency']:.2f} classes/MB\n")
+    if "std_dev_mb" in mem:
+        w(f"Memory Stability (Std Dev): {mem['std_dev_mb']:.2f} MB\n")
+    w(f"Memory per Class: {mem['peak_bytes'] / max(1, input_metrics['unique_class_count']):.2f} bytes/class\n")
 
     # CPU metrics
-    lines.append("\nCPU USAGE")
-    lines.append("-" * 80)
-    lines.append(
-        f"User CPU Time: {format_time(metrics['process']['cpu']['user_time'])}")
-    lines.append(
-        f"System CPU Time: {format_time(metrics['process']['cpu']['system_time'])}")
-    lines.append(
-        f"Total CPU Time: {format_time(metrics['process']['cpu']['total_time'])}")
+    w("\nCPU USAGE\n")
+    w("-" * 80 + "\n")
+    w(f"User CPU Time: {format_time(cpu_times['user_time'])}\n")
+    w(f"System CPU Time: {format_time(cpu_times['system_time'])}\n")
+    w(f"Total CPU Time: {format_time(cpu_times['total_time'])}\n")
 
     # I/O and Output metrics
-    lines.append("\nI/O & OUTPUT METRICS")
-    lines.append("-" * 80)
-    lines.append(
-        f"Total Read: {format_bytes(metrics['process']['io']['read_bytes'])}")
-    lines.append(
-        f"Total Written: {format_bytes(metrics['process']['io']['write_bytes'])}")
-    lines.append(f"Output File Count: {metrics['output']['file_count']}")
-    lines.append(
-        f"Output Size: {format_bytes(metrics['output']['total_size_bytes'])}")
+    w("\nI/O & OUTPUT METRICS\n")
+    w("-" * 80 + "\n")
+    w(f"Total Read: {format_bytes(io_metrics['read_bytes'])}\n")
+    w(f"Total Written: {format_bytes(io_metrics['write_bytes'])}\n")
+    w(f"Output File Count: {output['file_count']}\n")
+    w(f"Output Size: {format_bytes(output['total_size_bytes'])}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_comparison_report(results):
@@ -172,41 +178,24 @@ def generate_comparison_report(results):
         return "Insufficient data for framework comparison."
 
     # Format the comparison report
-    lines = []
-    lines.append("=" * 80)
-    lines.append("CSS FRAMEWORKS PERFORMANCE COMPARISON")
-    lines.append("=" * 80)
-
-    # Add timestamp
-    timestamp = system_info.get("timestamp_human",
-                                datetime.fromtimestamp(time.time()).strftime("%Y-%m-%d %H:%M:%S"))
-    lines.append(f"Generated: {timestamp}")
-
-    # Add system info
-    if system_info:
-        lines.append("\nSYSTEM INFORMATION")
-        lines.append("-" * 80)
-        lines.append(
-            f"OS:      {system_info.get('os', {}).get('name', 'Unknown')} {system_info.get('os', {}).get('release', '')}")
-        lines.append(
-            f"CPU:     {system_info.get('cpu', {}).get('name', 'Unknown')}")
-        lines.append(
-            f"Cores:   {system_info.get('cpu', {}).get('cores_physical', 'Unknown')} physical, {system_info.get('cpu', {}).get('cores_logical', 'Unknown')} logical")
-        lines.append(
-            f"Memory:  {system_info.get('memory', {}).get('total_gb', 'Unknown')} GB")
-
-        jobs_value = system_info.get('benchmark', {}).get('grimoire_css_jobs', None)
-        if jobs_value is not None:
-            lines.append(f"GRIMOIRE_CSS_JOBS: {jobs_value}")
+    buf = io.StringIO()
+    w = buf.write
+    w("=" * 80 + "\n")
+    w("CSS FRAMEWORKS PERFORMANCE COMPARISON\n")
+    w("=" * 80 + "\n")
+
+    w(_header_block(system_info))
 
     # Performance comparison
-    lines.append("\nPERFORMANCE COMPARISON")
-    lines.append("-" * 80)
+    w("\nPERFORMANCE COMPARISON\n")
+    w("-" * 80 + "\n")
 
     # Build comparison table
     headers = ["Metric", "Grimoire CSS",
                "Tailwind CSS", "Difference", "Ratio (G/T)"]
     rows = []
+    # Column widths grow as rows are added, starting from the header widths
+    column_widths = [len(header) for header in headers]
 
     # Get metrics for comparison
     metrics = {
@@ -234,13 +223,13 @@ def generate_comparison_report(results):
 
                 ratio_text = f"{ratio:.2f}x"
 
-                rows.append([
+                row = [
                     metric_name,
                     formatter(g_value),
                     formatter(t_value),
                     diff_text,
                     ratio_text if metric_name == "Build Time" else f"{ratio:.2f}x"
-                ])
+                ]
             else:
                 # Higher is better
                 difference = g_value - t_value
@@ -248,34 +237,37 @@ def generate_comparison_report(results):
 
                 diff_text = f"{formatter(abs(difference))}"
 
-                rows.append([
+                row = [
                     metric_name,
                     formatter(g_value),
                     formatter(t_value),
                     diff_text,
                     f"{ratio:.2f}x"
-                ])
+                ]
+
+            rows.append(row)
+            for i, cell in enumerate(row):
+                if len(cell) > column_widths[i]:
+                    column_widths[i] = len(cell)
 
     # Format the table
-    column_widths = [max(len(row[i]) for row in [headers] + rows)
-                     for i in range(len(headers))]
 
     # Add header
-    lines.append(" | ".join(headers[i].ljust(
-        column_widths[i]) for i in range(len(headers))))
-    lines.append("-" * (sum(column_widths) + 3 * len(column_widths)))
+    w(" | ".join(headers[i].ljust(
+        column_widths[i]) for i in range(len(headers))) + "\n")
+    w("-" * (sum(column_widths) + 3 * len(column_widths)) + "\n")
 
     # Add rows
     for row in rows:
-        lines.append(" | ".join(row[i].ljust(column_widths[i])
-                     for i in range(len(row))))
+        w(" | ".join(row[i].ljust(column_widths[i])
+                     for i in range(len(row))) + "\n")
 
-    # Add notes
-    lines.append("\nNotes:")
+    # Add notes; the last line carries no trailing newline
+    w("\nNotes:")
     for metric_name, (_, _, note) in metrics.items():
-        lines.append(f"- {metric_name}: {note}")
+        w(f"\n- {metric_name}: {note}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
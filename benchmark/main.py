@@ -24,12 +24,14 @@ Options:
 
 import argparse
 import json
+import logging
 import platform
 import psutil
 import time
 import datetime
 import subprocess
 import os
+import sys
 from pathlib import Path
 
 from core.project_creator import create_benchmark_projects
@@ -37,6 +39,9 @@ from core.metrics_collector import GrimoireMetricsCollector, TailwindMetricsColl
 from core.report_generator import generate_report, generate_comparison_report
 from core.benchmark_formatter import format_benchmark_results
 
+# Placed between the individual reports in the combined and displayed text output
+_REPORT_SEP = "\n\n" + "=" * 80 + "\n\n"
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -99,17 +104,20 @@ def collect_system_info():
     except Exception:
         pass
 
+    # platform.uname() gathers every field in one cached call
+    uname = platform.uname()
+
     return {
         "os": {
-            "name": platform.system(),
-            "version": platform.version(),
-            "release": platform.release()
+            "name": uname.system,
+            "version": uname.version,
+            "release": uname.release
         },
         "benchmark": {
             "grimoire_css_jobs": jobs_value,
         },
         "cpu": {
-            "name": platform.processor() or platform.machine(),
+            "name": uname.processor or uname.machine,
             "cores_logical": psutil.cpu_count(logical=True),
             "cores_physical": psutil.cpu_count(logical=False)
         },
@@ -217,7 +225,7 @@ def generate_and_save_reports(framework_results, system_info, args):
         text_reports.append(comparison_report)
 
     # Combined text report
-    full_text_report = "\n\n" + "="*80 + "\n\n".join(text_reports)
+    full_text_report = _REPORT_SEP.join(text_reports)
 
     # Save and display results based on format preference
     if args.output_format in ['json', 'both']:
@@ -241,9 +249,7 @@ def generate_and_save_reports(framework_results, system_info, args):
 
     # Display reports if text output is requested
     if args.output_format in ['text', 'both']:
-        for report in text_reports:
-            print(report)
-            print("\n" + "="*80 + "\n")
+        print(_REPORT_SEP.join(text_reports))
 
     return full_results
 
@@ -252,6 +258,18 @@ def main():
     """Main entry point for the benchmark."""
     args = parse_args()
 
+    # Collector messages go through logging; GRIMOIRE_BENCH_LOG sets the level.
+    # They share stdout with the rest of the report so redirected runs stay in order.
+    level_name = os.environ.get("GRIMOIRE_BENCH_LOG", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    logging.basicConfig(
+        level=level if isinstance(level, int) else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout)
+    if not isinstance(level, int):
+        logging.getLogger(__name__).warning(
+            "Warning: Unknown GRIMOIRE_BENCH_LOG level %r, using INFO", level_name)
+
     # Handle format-only mode
     if args.format_only:
         return handle_format_only(args)
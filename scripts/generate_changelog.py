@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+import os
 import re
 import subprocess
 import sys
@@ -20,40 +22,42 @@ This file is auto-generated from per-version release notes in `releases/`.
 Do not edit it manually — edit the corresponding file in `releases/` and re-run the generator.
 """
 
-VERSION_RE = re.compile(r"^v(\d+)\.(\d+)\.(\d+)\.md$")
+VERSION_RE = re.compile(r"^v(\d+)\.(\d+)\.(\d+)\.md$", re.ASCII)
+_match_version = VERSION_RE.match
 
 
 def parse_version(file_name: str) -> tuple[int, int, int] | None:
-    match = VERSION_RE.match(file_name)
+    match = _match_version(file_name)
     if not match:
         return None
     return int(match.group(1)), int(match.group(2)), int(match.group(3))
 
 
-def try_git_tag_date(repo_root: Path, tag: str) -> str | None:
-    try:
-        subprocess.run(
-            ["git", "rev-parse", "-q", "--verify", f"refs/tags/{tag}"],
-            cwd=repo_root,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=True,
-        )
-    except Exception:
-        return None
-
+def read_git_tag_dates(repo_root: Path) -> dict[str, str]:
+    # One for-each-ref call covers every tag. Dates match `git log -1 --format=%as <tag>`: the author
+    # date of the tagged commit, read through the tag object (`*`) for annotated tags.
     try:
         result = subprocess.run(
-            ["git", "log", "-1", "--format=%as", tag],
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(refname:lstrip=2)%09%(*authordate:short)%09%(authordate:short)",
+                "refs/tags/v*",
+            ],
             cwd=repo_root,
             capture_output=True,
             text=True,
             check=True,
         )
-        date = result.stdout.strip()
-        return date or None
     except Exception:
-        return None
+        return {}
+
+    dates: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        tag, peeled_date, own_date = line.split("\t")
+        if peeled_date or own_date:
+            dates[tag] = peeled_date or own_date
+    return dates
 
 
 def validate_entry_format(version: str, entry_md: str) -> None:
@@ -88,35 +92,48 @@ def main() -> int:
         return 1
 
     entry_files: list[tuple[tuple[int, int, int], Path]] = []
-    for path in entries_dir.glob("v*.md"):
-        version = parse_version(path.name)
-        if version is None:
-            continue
-        entry_files.append((version, path))
+    with os.scandir(entries_dir) as it:
+        for entry in it:
+            # Cheap prefix/suffix check before the regex; Path objects only for matches.
+            name = entry.name
+            if not (name.startswith("v") and name.endswith(".md")):
+                continue
+            version = parse_version(name)
+            if version is None:
+                continue
+            entry_files.append((version, Path(entry.path)))
 
     # True semver descending.
     entry_files.sort(key=lambda x: (-x[0][0], -x[0][1], -x[0][2], str(x[1])))
 
-    parts: list[str] = [HEADER, "\n", "## [Unreleased]\n\n", "(no unreleased changes recorded)\n\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w(HEADER)
+    w("\n## [Unreleased]\n\n(no unreleased changes recorded)\n\n")
 
     generated_date = date.today().isoformat()
+    tag_dates = read_git_tag_dates(repo_root)
 
     for (major, minor, patch), entry_path in entry_files:
         version_str = f"v{major}.{minor}.{patch}"
-        tag_date = try_git_tag_date(repo_root, version_str)
-        date_str = tag_date if tag_date is not None else generated_date
+        date_str = tag_dates.get(version_str, generated_date)
 
         entry_md = entry_path.read_text(encoding="utf-8")
         validate_entry_format(version_str, entry_md)
         entry_md = normalize_entry(entry_md)
 
-        parts.append(f"## [{version_str}] - {date_str}\n\n")
-        parts.append(f"> Full release notes: [releases/{version_str}.md](./releases/{version_str}.md)\n\n")
-        parts.append(entry_md)
+        w(f"## [{version_str}] - {date_str}\n\n")
+        w(f"> Full release notes: [releases/{version_str}.md](./releases/{version_str}.md)\n\n")
+        w(entry_md)
         if not entry_md.endswith("\n\n"):
-            parts.append("\n")
+            w("\n")
+
+    full = buf.getvalue().rstrip("\n") + "\n"
+    if output_path.is_file() and output_path.read_bytes() == full.encode("utf-8"):
+        print("CHANGELOG.md is already up to date.")
+        return 0
 
-    output_path.write_text("".join(parts).rstrip("\n") + "\n", encoding="utf-8")
+    output_path.write_text(full, encoding="utf-8")
     print("CHANGELOG.md has been updated from releases/*.md")
     return 0
 
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import re
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 
-HEADER = """# Grimoire CSS Releases
+HEADER = b"""# Grimoire CSS Releases
 
 ## Overview
 
@@ -15,7 +17,7 @@ This document combines all release notes in chronological order, providing a com
 """
 
 
-FALLBACK_V1_0_0 = """
+FALLBACK_V1_0_0 = b"""
 
 ---
 
@@ -25,15 +27,31 @@ The debut release of Grimoire CSS, introducing a powerful CSS engine designed fo
 """
 
 
-VERSION_RE = re.compile(r"^v(\d+)\.(\d+)\.(\d+)\.md$")
-
-
 def parse_version(file_name: str) -> tuple[int, int, int] | None:
-    match = VERSION_RE.match(file_name)
-    if not match:
+    # Parses "vMAJOR.MINOR.PATCH.md" with plain string operations.
+    if not (file_name.startswith("v") and file_name.endswith(".md")):
+        return None
+    core = file_name[1:-3]
+    # Same ASCII-only digits as generate_changelog's VERSION_RE.
+    if not core.isascii():
+        return None
+    parts = core.split(".")
+    if len(parts) != 3:
         return None
-    major, minor, patch = (int(match.group(1)), int(match.group(2)), int(match.group(3)))
-    return major, minor, patch
+    major, minor, patch = parts
+    # isdecimal() rejects signs, whitespace and underscores that int() would accept.
+    if not (major.isdecimal() and minor.isdecimal() and patch.isdecimal()):
+        return None
+    return int(major), int(minor), int(patch)
+
+
+def read_release(path: str) -> bytes:
+    with open(path, "rb") as f:
+        content = f.read()
+    if b"\r" in content:
+        # Match text-mode reading, which turned CRLF/CR line endings into LF.
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return content
 
 
 def main() -> int:
@@ -45,33 +63,46 @@ def main() -> int:
         print(f"error: releases dir not found: {releases_dir}", file=sys.stderr)
         return 1
 
-    release_files: list[tuple[tuple[int, int, int], Path]] = []
+    release_files: list[tuple[tuple[int, int, int], str]] = []
 
-    for path in releases_dir.glob("v*.md"):
-        version = parse_version(path.name)
-        if version is None:
-            continue
-        release_files.append((version, path))
+    with os.scandir(releases_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not (name.startswith("v") and name.endswith(".md")):
+                continue
+            version = parse_version(name)
+            if version is None:
+                continue
+            release_files.append((version, entry.path))
 
     # Sort order: true semver descending (newest version first)
-    release_files.sort(key=lambda x: (-x[0][0], -x[0][1], -x[0][2], str(x[1])))
-
-    parts: list[str] = [HEADER]
-
-    for _, file_path in release_files:
-        parts.append("\n---\n\n")
-        content = file_path.read_text(encoding="utf-8")
-        parts.append(content)
-        if not content.endswith("\n"):
-            parts.append("\n")
-
-    full = "".join(parts)
-
-    if "v1.0.0" not in full:
-        full += FALLBACK_V1_0_0
-
-    output_path.write_text(full, encoding="utf-8")
-
+    release_files.sort(key=itemgetter(0), reverse=True)
+
+    # Release notes are UTF-8 and only copied through, so they stay bytes end to end.
+    # The output is assembled in one growing buffer so it can be compared with the
+    # current file.
+    buf = bytearray(HEADER)
+    # The v1.0.0 notes are present exactly when a release file parsed as (1, 0, 0).
+    have_v1 = any(version == (1, 0, 0) for version, _ in release_files)
+
+    # Reads overlap in a thread pool; map() still yields them in sorted order.
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(release_files)))) as executor:
+        contents = executor.map(read_release, [file_path for _, file_path in release_files])
+        for content in contents:
+            buf += b"\n---\n\n"
+            buf += content
+            if not content.endswith(b"\n"):
+                buf.append(0x0A)
+
+    if not have_v1:
+        buf += FALLBACK_V1_0_0
+
+    # Unchanged output keeps its mtime.
+    if output_path.is_file() and output_path.read_bytes() == buf:
+        print("RELEASES.md is already up to date.")
+        return 0
+
+    output_path.write_bytes(buf)
     print("RELEASES.md has been updated with full release notes in chronological order.")
     return 0
 
@@ -4,11 +4,62 @@ from __future__ import annotations
 
 import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 
-VERSION_HEADER_RE = re.compile(r"^## \[(v\d+\.\d+\.\d+)\] - (.+)$")
-SECTION_RE = re.compile(r"^### (Added|Improved|Fixed|Changed|Deprecated|Removed|Security)\s*$")
+VERSION_HEADER_RE = re.compile(rb"^## \[(v\d+\.\d+\.\d+)\] - .+$", re.MULTILINE)
+# Recognized section headings (body lines are right-stripped before lookup),
+# mapped to their Keep a Changelog name.
+SECTION_MAP = {
+    b"### Added": b"### Added",
+    b"### Improved": b"### Changed",
+    b"### Fixed": b"### Fixed",
+    b"### Changed": b"### Changed",
+    b"### Deprecated": b"### Deprecated",
+    b"### Removed": b"### Removed",
+    b"### Security": b"### Security",
+}
+
+
+def parse_changelog(text: bytes) -> Iterator[tuple[str, list[bytes]]]:
+    # Split into [preamble, version1, body1, version2, body2, ...] in one pass.
+    # Each body starts with the newline that ended its header line.
+    parts = VERSION_HEADER_RE.split(text)
+    for version, body in zip(parts[1::2], parts[2::2]):
+        yield version.decode("ascii"), body.split(b"\n")[1:]
+
+
+def normalize(body: list[bytes]) -> list[bytes]:
+    # Trim boilerplate and links; keep only section headings + bullets.
+    body_lines: list[bytes] = []
+    for line in body:
+        stripped = line.strip()
+        if stripped == b"---" or stripped.startswith(b"> Full release notes:"):
+            continue
+        body_lines.append(line.rstrip())
+
+    # Remove leading/trailing blank lines. Kept lines are already
+    # right-stripped, so a blank line is an empty one; after this the joined
+    # body never ends in a newline.
+    start = 0
+    end = len(body_lines)
+    while start < end and not body_lines[start]:
+        start += 1
+    while end > start and not body_lines[end - 1]:
+        end -= 1
+
+    # Normalize headings to Keep a Changelog sections.
+    return [SECTION_MAP.get(line, line) for line in body_lines[start:end]]
+
+
+def _write_entry(out_dir: Path, version: str, data: bytes) -> None:
+    out_path = out_dir / f"{version}.md"
+    if out_path.is_file() and out_path.read_bytes() == data:
+        return
+    out_path.write_bytes(data)
 
 
 def main() -> int:
@@ -22,65 +73,23 @@ def main() -> int:
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    lines = changelog_path.read_text(encoding="utf-8").splitlines()
-
-    current_version: str | None = None
-    current_body: list[str] = []
-
-    def flush() -> None:
-        nonlocal current_version, current_body
-        if current_version is None:
-            return
-
-        # Trim boilerplate and links; keep only section headings + bullets.
-        body_lines: list[str] = []
-        for line in current_body:
-            if line.strip() == "---":
-                continue
-            if line.strip().startswith("> Full release notes:"):
-                continue
-            body_lines.append(line.rstrip())
-
-        # Remove leading/trailing blank lines.
-        while body_lines and body_lines[0].strip() == "":
-            body_lines.pop(0)
-        while body_lines and body_lines[-1].strip() == "":
-            body_lines.pop()
-
-        # Normalize headings to Keep a Changelog sections.
-        normalized: list[str] = []
-        for line in body_lines:
-            m = SECTION_RE.match(line)
-            if m:
-                section = m.group(1)
-                if section == "Improved":
-                    section = "Changed"
-                normalized.append(f"### {section}")
-                continue
-            normalized.append(line)
-
-        out_path = out_dir / f"{current_version}.md"
-        out_path.write_text("\n".join(normalized).rstrip("\n") + "\n", encoding="utf-8")
-
-        current_version = None
-        current_body = []
-
-    # Parse file.
-    for line in lines:
-        m = VERSION_HEADER_RE.match(line)
-        if m:
-            flush()
-            current_version = m.group(1)
-            current_body = []
-            continue
-
-        if current_version is None:
-            continue
-
-        # Stop at next version delimiter handled above; otherwise keep.
-        current_body.append(line)
-
-    flush()
+    # The changelog is processed as UTF-8 bytes throughout; only the markers
+    # matched below are ASCII, so nothing needs decoding.
+    text = changelog_path.read_bytes()
+    if b"\r" in text:
+        # Normalize CRLF/CR line endings so header lines split cleanly.
+        text = text.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    # Keyed by version so a repeated header still ends up with the last body,
+    # and no two writers ever touch the same file.
+    entries = {
+        version: b"\n".join(normalize(body_lines)) + b"\n"
+        for version, body_lines in parse_changelog(text)
+    }
+
+    # Writes overlap in a thread pool; list() surfaces the first error.
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(entries)))) as executor:
+        list(executor.map(partial(_write_entry, out_dir), entries.keys(), entries.values()))
 
     print(f"Seeded changelog entries into: {out_dir}")
     return 0